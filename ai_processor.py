@@ -7,10 +7,60 @@ import re
 import logging
 import os
 import socket
-from typing import Dict, List
+import threading
+from typing import Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Enhanced key phrases by category
+KEY_INDICATORS = {
+    'ai': frozenset({'announces', 'launches', 'breakthrough', 'develops', 'ai', 'model', 'algorithm', 'machine learning', 'neural', 'artificial intelligence'}),
+    'finance': frozenset({'reports', 'earnings', 'revenue', 'profit', 'investment', 'funding', 'market', 'stock', 'financial', 'economic', 'fed', 'rate'}),
+    'politics': frozenset({'policy', 'legislation', 'congress', 'senate', 'president', 'governor', 'election', 'vote', 'political', 'government'})
+}
+DEFAULT_KEY_INDICATORS = frozenset({
+    'announces', 'launches', 'reports', 'reveals', 'shows', 'increases', 'decreases',
+    'plans', 'expects', 'breakthrough', 'develops', 'creates', 'discovers'
+})
+
+def _indicator_pattern(indicators) -> re.Pattern:
+    """Compile indicators into one whole-word alternation (so 'ai' no longer matches 'said')"""
+    return re.compile(r'\b(?:' + '|'.join(re.escape(indicator) for indicator in indicators) + r')\b')
+
+KEY_INDICATOR_PATTERNS = {category: _indicator_pattern(indicators) for category, indicators in KEY_INDICATORS.items()}
+DEFAULT_KEY_INDICATOR_PATTERN = _indicator_pattern(DEFAULT_KEY_INDICATORS)
+
+# Category-specific formatting shared by every summary backend
+SUMMARY_PREFIXES = {
+    "ai": "🤖 AI Development",
+    "finance": "💰 Market Update",
+    "politics": "🏛️ Policy Update"
+}
+DEFAULT_SUMMARY_PREFIX = "📰 News Update"
+
+SUMMARY_CONTEXTS = {
+    "ai": "This is an AI and technology news article. Focus on technical developments, business impact, and implications for the AI industry.",
+    "finance": "This is a financial news article. Focus on market impact, economic implications, and key financial metrics or changes.",
+    "politics": "This is a political news article. Focus on policy implications, political developments, and potential societal impact."
+}
+
+OVERVIEW_CATEGORY_NAMES = {
+    'ai': "📱 Technology developments",
+    'finance': "💰 Market movements",
+    'politics': "🏛️ Policy updates"
+}
+
+# Model input cleanup: tag remnants, whitespace runs, and characters outside plain prose
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s\.\,\!\?\-\:\;]')
+
+# Articles fed through the summarization model per forward pass
+SUMMARY_BATCH_SIZE = 8
+
+# Sentence boundaries: terminal punctuation followed by whitespace
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
 class RPNewsAI:
     """Advanced AI news analysis with open source LLMs"""
     
@@ -19,6 +69,8 @@ class RPNewsAI:
         self.ai_available = False
         self.ollama_available = False
         self.transformers_available = False
+        # Pipelines aren't thread-safe and each call already uses every core, so run one at a time
+        self._model_lock = threading.Lock()
         logger.info("🤖 Initializing AI analysis system with open source models...")
         
         # Try Ollama first (best for local/self-hosted LLMs)
@@ -56,6 +108,11 @@ class RPNewsAI:
         except Exception as e:
             logger.info(f"ℹ️ Ollama not available: {e}")
         
+        # A locally exported ONNX model needs no download and runs fused CPU kernels
+        onnx_dir = os.environ.get("ONNX_MODEL_DIR")
+        if not self.ai_available and onnx_dir:
+            self._load_onnx_summarizer(onnx_dir)
+        
         # Try Hugging Face Transformers if Ollama failed and network is available
         if not self.ai_available:
             if self._has_network():
@@ -109,6 +166,26 @@ class RPNewsAI:
         else:
             logger.info("📝 Using enhanced rule-based analysis")
 
+    def _load_onnx_summarizer(self, model_dir: str):
+        """Load a summarization model exported with `optimum-cli export onnx` onto ONNX Runtime"""
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+            from transformers import AutoTokenizer, pipeline
+            
+            self.summarizer = pipeline(
+                "summarization",
+                model=ORTModelForSeq2SeqLM.from_pretrained(model_dir, provider="CPUExecutionProvider"),
+                tokenizer=AutoTokenizer.from_pretrained(model_dir)
+            )
+            self.ai_available = True
+            self.transformers_available = True
+            self.ai_type = f"onnx_{os.path.basename(os.path.normpath(model_dir))}"
+            logger.info(f"✅ ONNX Runtime model loaded: {model_dir}")
+        except ImportError:
+            logger.info("📝 optimum[onnxruntime] not installed, skipping ONNX model")
+        except Exception as e:
+            logger.warning(f"⚠️ ONNX model load failed: {e}")
+    
     def _has_network(self) -> bool:
         """Check if basic network connectivity is available"""
         try:
@@ -126,6 +203,33 @@ class RPNewsAI:
         else:
             return self._smart_rule_summary(title, content, category)
     
+    def summarize_batch(self, items: List[Tuple[str, str, str]]) -> List[str]:
+        """Summarize (title, content, category) items, in one model call under the model lock when transformers is the backend"""
+        if not items:
+            return []
+        if self.ollama_available or not self.transformers_available:
+            return [self.generate_summary(title, content, category) for title, content, category in items]
+        
+        try:
+            # Same cleaning and 500-word cap as the single-article path
+            texts = [" ".join(self._clean_text(content).split()[:500]) for _, content, _ in items]
+            with self._model_lock:
+                results = self.summarizer(
+                    texts,
+                    max_length=120,
+                    min_length=40,
+                    do_sample=False,
+                    truncation=True,
+                    batch_size=SUMMARY_BATCH_SIZE
+                )
+            return [
+                f"{SUMMARY_PREFIXES.get(category, DEFAULT_SUMMARY_PREFIX)}: {result['summary_text']}"
+                for (_, _, category), result in zip(items, results)
+            ]
+        except Exception as e:
+            logger.warning(f"Batch summary failed: {e}")
+            return [self._transformers_summary(title, content, category) for title, content, category in items]
+    
     def _ollama_summary(self, title: str, content: str, category: str) -> str:
         """Generate summary using Ollama (local LLM)"""
         try:
@@ -134,13 +238,7 @@ class RPNewsAI:
             # Clean content for API
             clean_content = self._clean_text(content)[:2000]  # Limit for local processing
             
-            category_context = {
-                "ai": "This is an AI and technology news article. Focus on technical developments, business impact, and implications for the AI industry.",
-                "finance": "This is a financial news article. Focus on market impact, economic implications, and key financial metrics or changes.",
-                "politics": "This is a political news article. Focus on policy implications, political developments, and potential societal impact."
-            }
-            
-            context = category_context.get(category, "This is a news article.")
+            context = SUMMARY_CONTEXTS.get(category, "This is a news article.")
             
             prompt = f"""{context} 
 
@@ -174,13 +272,7 @@ Summary:"""
                 summary = summary.replace("Summary:", "").strip()
                 
                 # Add category prefix
-                category_config = {
-                    "ai": "🤖 AI Development",
-                    "finance": "💰 Market Update",
-                    "politics": "🏛️ Policy Update"
-                }
-                
-                prefix = category_config.get(category, "📰 News Update")
+                prefix = SUMMARY_PREFIXES.get(category, DEFAULT_SUMMARY_PREFIX)
                 return f"{prefix}: {summary}"
             else:
                 logger.warning(f"Ollama API error: {response.status_code}")
@@ -202,24 +294,19 @@ Summary:"""
                 clean_content = " ".join(words[:500])
             
             # Generate summary with appropriate length
-            summary_result = self.summarizer(
-                clean_content,
-                max_length=120,
-                min_length=40,
-                do_sample=False,
-                truncation=True
-            )
+            with self._model_lock:
+                summary_result = self.summarizer(
+                    clean_content,
+                    max_length=120,
+                    min_length=40,
+                    do_sample=False,
+                    truncation=True
+                )
             
             ai_text = summary_result[0]['summary_text']
             
             # Category-specific formatting
-            category_config = {
-                "ai": "🤖 AI Development",
-                "finance": "💰 Market Update", 
-                "politics": "🏛️ Policy Update"
-            }
-            
-            prefix = category_config.get(category, "📰 News Update")
+            prefix = SUMMARY_PREFIXES.get(category, DEFAULT_SUMMARY_PREFIX)
             
             return f"{prefix}: {ai_text}"
             
@@ -230,67 +317,40 @@ Summary:"""
     def _clean_text(self, text: str) -> str:
         """Clean text for AI processing"""
         # Remove HTML remnants
-        text = re.sub(r'<[^>]+>', '', text)
+        text = HTML_TAG_PATTERN.sub('', text)
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         # Remove special characters that might confuse the model
-        text = re.sub(r'[^\w\s\.\,\!\?\-\:\;]', '', text)
+        text = SPECIAL_CHAR_PATTERN.sub('', text)
         return text.strip()
     
     def _smart_rule_summary(self, title: str, content: str, category: str) -> str:
         """Enhanced rule-based summary with intelligent parsing"""
         
         # Extract key sentences using importance indicators
-        sentences = content.replace('\n', ' ').split('.')
+        sentences = [sentence.strip() for sentence in SENTENCE_SPLIT_PATTERN.split(content)]
         important_sentences = []
         
-        # Enhanced key phrases by category
-        key_indicators = {
-            'ai': ['announces', 'launches', 'breakthrough', 'develops', 'ai', 'model', 'algorithm', 'machine learning', 'neural', 'artificial intelligence'],
-            'finance': ['reports', 'earnings', 'revenue', 'profit', 'investment', 'funding', 'market', 'stock', 'financial', 'economic', 'fed', 'rate'],
-            'politics': ['policy', 'legislation', 'congress', 'senate', 'president', 'governor', 'election', 'vote', 'political', 'government']
-        }
-        
-        category_indicators = key_indicators.get(category, [
-            'announces', 'launches', 'reports', 'reveals', 'shows', 'increases', 'decreases',
-            'plans', 'expects', 'breakthrough', 'develops', 'creates', 'discovers'
-        ])
+        indicator_pattern = KEY_INDICATOR_PATTERNS.get(category, DEFAULT_KEY_INDICATOR_PATTERN)
         
         for sentence in sentences[:10]:  # Check first 10 sentences
-            sentence = sentence.strip()
-            if len(sentence) > 30:
-                # Score sentence based on keywords and position
-                score = 0
-                sentence_lower = sentence.lower()
-                
-                for indicator in category_indicators:
-                    if indicator in sentence_lower:
-                        score += 2
-                
-                # Boost for numbers, percentages, quotes
-                if re.search(r'\d+%|\$\d+|"\w+', sentence):
-                    score += 1
-                
-                if score >= 2:
-                    important_sentences.append(sentence)
+            # Any indicator hit scores enough to keep the sentence
+            if len(sentence) > 30 and indicator_pattern.search(sentence.lower()):
+                important_sentences.append(sentence)
         
         # Fallback to first meaningful sentences
         if not important_sentences:
-            important_sentences = [s.strip() for s in sentences[:3] if len(s.strip()) > 20]
+            important_sentences = [s for s in sentences[:3] if len(s) > 20]
         
-        # Create summary from top 2 sentences
-        key_info = '. '.join(important_sentences[:2])
+        # Create summary from top 2 sentences, which keep their own punctuation
+        key_info = ' '.join(important_sentences[:2])
+        if not key_info.endswith(('.', '!', '?')):
+            key_info += '.'
         
         # Category-specific formatting
-        category_config = {
-            "ai": "🤖 AI Development",
-            "finance": "💰 Market Update",
-            "politics": "🏛️ Policy Update"
-        }
+        prefix = SUMMARY_PREFIXES.get(category, DEFAULT_SUMMARY_PREFIX)
         
-        prefix = category_config.get(category, "📰 News Update")
-        
-        return f"{prefix}: {key_info}."
+        return f"{prefix}: {key_info}"
     
     def generate_daily_overview(self, articles_by_category: Dict[str, List]) -> str:
         """Generate comprehensive daily overview using best available AI"""
@@ -371,13 +431,14 @@ Daily Overview:"""
             
             # Generate AI overview
             if len(overview_text) > 100:
-                summary_result = self.summarizer(
-                    overview_text,
-                    max_length=150,
-                    min_length=60,
-                    do_sample=False,
-                    truncation=True
-                )
+                with self._model_lock:
+                    summary_result = self.summarizer(
+                        overview_text,
+                        max_length=150,
+                        min_length=60,
+                        do_sample=False,
+                        truncation=True
+                    )
                 return f"🌅 Today's Intelligence Overview: {summary_result[0]['summary_text']}"
             
         except Exception as e:
@@ -389,12 +450,6 @@ Daily Overview:"""
         """Rule-based daily overview generation"""
         overview_parts = []
         
-        category_summaries = {
-            'ai': "📱 Technology developments",
-            'finance': "💰 Market movements", 
-            'politics': "🏛️ Policy updates"
-        }
-        
         for category, articles in articles_by_category.items():
             if not articles:
                 continue
@@ -402,7 +457,7 @@ Daily Overview:"""
             high_priority_count = len([a for a in articles if a.get('priority') == 'high'])
             total_count = len(articles)
             
-            category_name = category_summaries.get(category, f"{category} updates")
+            category_name = OVERVIEW_CATEGORY_NAMES.get(category, f"{category} updates")
             
             if high_priority_count > 0:
                 overview_parts.append(f"{category_name}: {high_priority_count} major developments, {total_count} total articles")
@@ -6,24 +6,69 @@ Coordinates all components and serves the application with open source LLMs
 import os
 import logging
 import asyncio
-from fastapi import FastAPI, BackgroundTasks
+import gzip
+import hashlib
+from fastapi import FastAPI, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from news_engine import RPNewsEngine
-from api_routes import APIRoutes
+from api_routes import APIRoutes, wants_msgpack
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # Cloud deployment configuration
 PORT = int(os.environ.get("PORT", 8000))
 DATABASE_URL = os.environ.get("DATABASE_URL", "rpnews.db")
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# The dashboard shell never changes at runtime, so read it once
+with open(os.path.join(STATIC_DIR, "index.html"), "rb") as index_file:
+    INDEX_HTML = index_file.read()
+
+def asset_version(name: str) -> str:
+    """Short content hash used to fingerprint a static asset URL"""
+    with open(os.path.join(STATIC_DIR, name), "rb") as asset_file:
+        return hashlib.md5(asset_file.read()).hexdigest()[:12]
+
+# Drop indentation and blank lines; a newline still separates elements, so rendering is unchanged
+INDEX_HTML = b"\n".join(line.strip() for line in INDEX_HTML.splitlines() if line.strip())
+
+# Fingerprinted asset URLs change whenever the file does, so browsers may cache them forever
+for asset in ("styles.css", "app.js"):
+    INDEX_HTML = INDEX_HTML.replace(
+        f'"/static/{asset}"'.encode(), f'"/static/{asset}?v={asset_version(asset)}"'.encode()
+    )
+
+# Compress once at import; the root handler just picks an encoding
+INDEX_HTML_GZ = gzip.compress(INDEX_HTML, 9)
+INDEX_HTML_BR = brotli.compress(INDEX_HTML, quality=11) if brotli else None
+
+# Weak validator: every encoding above carries the same page
+INDEX_HTML_ETAG = f'W/"{hashlib.blake2b(INDEX_HTML, digest_size=8).hexdigest()}"'
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak If-None-Match comparison: accepts '*', comma-separated lists and W/ prefixes"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI application
-app = FastAPI(title="RPNews - Enhanced AI News Intelligence with Open Source LLMs", version="2.0.0")
+app = FastAPI(
+    title="RPNews - Enhanced AI News Intelligence with Open Source LLMs",
+    version="2.0.0",
+    default_response_class=ORJSONResponse
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -33,30 +78,72 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# JSON API responses compress well; the dashboard page arrives pre-compressed and is left alone
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Initialize the enhanced news engine and API routes
 news_engine = RPNewsEngine(DATABASE_URL)
 api_routes = APIRoutes(news_engine)
 
+class FingerprintedStaticFiles(StaticFiles):
+    """Static files whose versioned (?v=) URLs are marked immutable"""
+    
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if scope.get("query_string", b"").startswith(b"v=") and response.status_code == 200:
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 # Serve static files (frontend)
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", FingerprintedStaticFiles(directory=STATIC_DIR), name="static")
 
 @app.on_event("startup")
 async def startup_event():
     """Start background tasks when FastAPI starts"""
     logger.info("🚀 Enhanced FastAPI startup - starting background collection")
+    await news_engine.open_session()
     news_engine.start_background_collection()
+    api_routes.start_briefing_refresher()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the shared HTTP session when FastAPI stops"""
+    await news_engine.close_session()
 
 # Root endpoint - serve the main HTML page
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the main frontend page"""
-    return FileResponse('static/index.html')
+    headers = {"Vary": "Accept-Encoding", "Cache-Control": "public, max-age=300", "ETag": INDEX_HTML_ETAG}
+    if etag_matches(request.headers.get("if-none-match", ""), INDEX_HTML_ETAG):
+        return Response(status_code=304, headers=headers)
+    
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if INDEX_HTML_BR and "br" in accept_encoding:
+        content = INDEX_HTML_BR
+        headers["Content-Encoding"] = "br"
+    elif "gzip" in accept_encoding:
+        content = INDEX_HTML_GZ
+        headers["Content-Encoding"] = "gzip"
+    else:
+        content = INDEX_HTML
+    return Response(content=content, media_type="text/html; charset=utf-8", headers=headers)
 
 # API Endpoints - delegate to APIRoutes class
 @app.get("/api/morning-briefing")
-async def get_morning_briefing():
+async def get_morning_briefing(request: Request):
     """Generate comprehensive morning briefing with daily overview"""
-    return await api_routes.get_morning_briefing()
+    return await api_routes.get_morning_briefing(wants_msgpack(request))
+
+@app.get("/api/morning-briefing.html")
+async def get_morning_briefing_html():
+    """Server-rendered article cards for the briefing view"""
+    return await api_routes.get_morning_briefing_html()
+
+@app.get("/api/articles/{article_id}/content")
+async def get_article_content(article_id: str):
+    """Full stored text of one article"""
+    return await api_routes.get_article_content(article_id)
 
 @app.post("/api/articles/{article_id}/read")
 async def mark_article_read(article_id: str):
@@ -84,19 +171,29 @@ async def get_starred_articles():
     return await api_routes.get_starred_articles()
 
 @app.get("/api/articles/{category}")
-async def get_articles(category: str, limit: int = 50, priority: str = "all"):
+async def get_articles(request: Request, category: str, limit: int = 50, priority: str = "all"):
     """Get articles for a specific category with enhanced features"""
-    return await api_routes.get_articles(category, limit, priority)
+    return await api_routes.get_articles(category, limit, priority, wants_msgpack(request))
 
 @app.get("/api/stats")
 async def get_stats():
     """Enhanced platform statistics"""
     return await api_routes.get_stats()
 
+@app.get("/api/status")
+async def get_status():
+    """Article counts snapshot refreshed after each collection"""
+    return api_routes.get_status()
+
+@app.get("/api/events")
+async def stream_events(request: Request):
+    """Push a notification to dashboards whenever new articles are collected"""
+    return await api_routes.stream_events(request)
+
 @app.post("/api/collect")
-async def trigger_collection(background_tasks: BackgroundTasks):
+async def trigger_collection(background_tasks: BackgroundTasks, wait: bool = False):
     """Enhanced manual collection trigger"""
-    return await api_routes.trigger_collection(background_tasks)
+    return await api_routes.trigger_collection(background_tasks, wait)
 
 @app.get("/api/health")
 async def health_check():
@@ -7,21 +7,306 @@ Enhanced with article passing and better distribution
 import asyncio
 import aiohttp
 import feedparser
-import json
+import orjson
 import logging
 import sqlite3
 import hashlib
+import html
 import re
+import threading
+import io
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+import time
+import zlib
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from typing import List, Dict, Any, Optional, NamedTuple, Tuple
+from dataclasses import dataclass, replace
+from urllib.parse import urlparse
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 
 from ai_processor import RPNewsAI
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Categories collected, in display order
+CATEGORIES = ('ai', 'finance', 'politics')
+
+# Feeds fetched at once per category, and the pause kept between hits on one host
+FETCH_CONCURRENCY = 20
+HOST_DELAY_SECONDS = 2
+
+# Per-feed refresh interval bounds; quiet feeds back off, busy feeds speed up
+DEFAULT_FETCH_INTERVAL = 3600
+MIN_FETCH_INTERVAL = 600
+MAX_FETCH_INTERVAL = 86400
+BUSY_FEED_NEW_ITEMS = 3
+
+# Events buffered per /api/events client before new ones are dropped
+EVENT_QUEUE_SIZE = 16
+
+# Tag keywords per category; "politics" doubles as the fallback set
+TAG_KEYWORDS = {
+    'ai': {
+        'gpt': ['gpt', 'chatgpt', 'gpt-4', 'gpt-3'],
+        'llm': ['language model', 'llm', 'large language'],
+        'ml': ['machine learning', 'deep learning', 'neural network'],
+        'startup': ['startup', 'funding', 'investment', 'series a', 'series b'],
+        'research': ['paper', 'research', 'arxiv', 'study', 'journal'],
+        'robotics': ['robot', 'robotics', 'autonomous'],
+        'computer_vision': ['computer vision', 'image recognition', 'cv'],
+        'nlp': ['natural language', 'nlp', 'text processing'],
+        'ethics': ['ethics', 'bias', 'fairness', 'responsible ai']
+    },
+    'finance': {
+        'crypto': ['bitcoin', 'cryptocurrency', 'crypto', 'ethereum'],
+        'stocks': ['stock', 'equity', 'shares', 'nasdaq', 'sp500'],
+        'fed': ['federal reserve', 'fed', 'interest rate', 'fomc'],
+        'market': ['market', 'trading', 'dow jones'],
+        'banking': ['bank', 'banking', 'credit', 'loan'],
+        'inflation': ['inflation', 'cpi', 'consumer price'],
+        'earnings': ['earnings', 'revenue', 'profit', 'quarterly'],
+        'ipo': ['ipo', 'public offering', 'listing'],
+        'merger': ['merger', 'acquisition', 'm&a']
+    },
+    'politics': {
+        'congress': ['congress', 'senate', 'house', 'representatives'],
+        'election': ['election', 'vote', 'campaign', 'ballot'],
+        'policy': ['policy', 'legislation', 'bill', 'law'],
+        'international': ['international', 'foreign', 'diplomatic'],
+        'supreme_court': ['supreme court', 'scotus', 'judicial'],
+        'presidency': ['president', 'white house', 'administration'],
+        'healthcare': ['healthcare', 'medicare', 'medicaid'],
+        'economy': ['economic', 'fiscal', 'budget'],
+        'climate': ['climate', 'environmental', 'green energy']
+    }
+}
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile a keyword list into one substring alternation"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# One compiled alternation per tag, so each tag is a single C-level scan
+TAG_PATTERNS = {
+    category: tuple((tag, _keyword_pattern(keywords)) for tag, keywords in terms.items())
+    for category, terms in TAG_KEYWORDS.items()
+}
+
+# One bit per tag name, in TAG_KEYWORDS order so decoded tags keep extraction order
+TAG_BITS = {
+    tag: 1 << bit
+    for bit, tag in enumerate(tag for terms in TAG_KEYWORDS.values() for tag in terms)
+}
+
+def encode_tags(tags: List[str]) -> int:
+    """Pack tag names into the integer stored in articles.tag_mask"""
+    mask = 0
+    for tag in tags:
+        mask |= TAG_BITS.get(tag, 0)
+    return mask
+
+@lru_cache(maxsize=1024)
+def decode_tags(mask: Optional[int]) -> tuple:
+    """Unpack a tag_mask back into tag names; only a handful of masks ever occur"""
+    if not mask:
+        return ()
+    return tuple(tag for tag, bit in TAG_BITS.items() if mask & bit)
+
+# Category-specific high-priority indicators
+HIGH_PRIORITY_TERMS = {
+    'ai': (
+        'breakthrough', 'released', 'announces', 'launches', 'gpt-', 'claude',
+        'funding round', 'acquisition', 'partnership', 'regulation', 'banned',
+        'agi', 'superintelligence', '$', 'billion', 'million funding'
+    ),
+    'finance': (
+        'fed decision', 'interest rate', 'inflation', 'recession', 'crash',
+        'bank failure', 'earnings beat', 'guidance', 'outlook', 'upgraded',
+        'downgraded', 'merger', 'acquisition', 'ipo', 'bankruptcy'
+    ),
+    'politics': (
+        'breaking', 'urgent', 'senate votes', 'house passes', 'president',
+        'supreme court', 'indictment', 'investigation', 'scandal',
+        'election results', 'poll', 'debate', 'resignation', 'appointed'
+    )
+}
+
+URGENCY_PATTERN = _keyword_pattern(['breaking', 'urgent', 'just in', 'developing', 'alert'])
+DATA_POINT_PATTERN = re.compile(r'\d+%|\$\d+\.?\d*[bmk]|\d+\.\d+%')
+
+# Integer rank stored alongside priority so ORDER BY can be served from an index
+PRIORITY_RANK = {"high": 3, "medium": 2, "low": 1}
+
+@lru_cache(maxsize=512)
+def _hours_ago_label(hours_ago: int) -> str:
+    """Relative label for a whole number of hours; the same few values repeat on every page"""
+    if hours_ago < 1:
+        return "Just now"
+    if hours_ago < 24:
+        return f"{hours_ago}h ago"
+    return f"{hours_ago // 24}d ago"
+
+def format_time_ago(published_ts: Optional[int], now_ts: int) -> str:
+    """Render an epoch publish time as the dashboard's relative label"""
+    if published_ts is None:
+        return "Recently"
+    return _hours_ago_label((now_ts - published_ts) // 3600)
+
+def row_to_article(row: tuple, now_ts: int) -> Dict[str, Any]:
+    """Build the API article dict from a row selecting the standard article columns"""
+    (article_id, title, url, source, author, published_date, excerpt, ai_summary,
+     category, priority, tag_mask, reading_time, is_read, is_starred, published_ts) = row[:15]
+    return {
+        'id': article_id,
+        'title': title,
+        'url': url,
+        'source': source,
+        'author': author or 'Unknown',
+        'publishedDate': published_date,
+        'excerpt': excerpt,
+        'aiSummary': ai_summary,
+        'category': category,
+        'priority': priority,
+        'tags': decode_tags(tag_mask),
+        'readingTime': reading_time or 2,
+        'timeAgo': format_time_ago(published_ts, now_ts),
+        'isRead': bool(is_read),
+        'isStarred': bool(is_starred)
+    }
+
+# Totals reported by /api/health, loaded once and then kept up to date in memory
+COUNTERS_QUERY = """
+    SELECT COUNT(*),
+           SUM(CASE WHEN is_read = TRUE THEN 1 ELSE 0 END),
+           SUM(CASE WHEN is_starred = TRUE THEN 1 ELSE 0 END),
+           SUM(CASE WHEN is_passed = TRUE THEN 1 ELSE 0 END)
+    FROM articles
+"""
+
+# Per-category totals for the /api/status snapshot
+CATEGORY_COUNTS_QUERY = "SELECT category, COUNT(*) FROM articles GROUP BY category"
+
+INSERT_ARTICLE_QUERY = """
+    INSERT OR IGNORE INTO articles 
+    (id, title, url, source, author, published_date, published_ts, excerpt,
+     ai_summary, category, priority, priority_rank, tag_mask, reading_time, extracted_at,
+     is_read, is_starred, is_passed)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, FALSE, FALSE, FALSE)
+"""
+
+# Full text lives apart from the list columns, zlib-compressed; ids are md5(url), so no orphans
+INSERT_BODY_QUERY = "INSERT OR IGNORE INTO article_bodies (id, content) VALUES (?, ?)"
+
+# Ids recent enough to still show up in feeds; older entries fall back to INSERT OR IGNORE
+SEEN_IDS_QUERY = "SELECT id FROM articles WHERE published_date >= datetime('now', '-30 days')"
+
+# Today's ten top-ranked articles per category, in one pass, for the daily overview
+OVERVIEW_ARTICLES_QUERY = """
+    SELECT category, title, ai_summary, priority
+    FROM (
+        SELECT category, title, ai_summary, priority,
+               ROW_NUMBER() OVER (
+                   PARTITION BY category
+                   ORDER BY priority_rank DESC, published_date DESC
+               ) AS rn
+        FROM articles
+        WHERE category IN ('ai', 'finance', 'politics')
+        AND published_date >= date('now') AND published_date < date('now', '+1 day')
+    )
+    WHERE rn <= 10
+    ORDER BY category, rn
+"""
+
+# Hot-path statements kept as constants so the connection's statement cache reuses them
+# Run once per category: the IN list turns into one (category, rank, date) range seek per rank,
+# walked in index order, so there is no sort step and the scan stops after LIMIT rows
+BRIEFING_QUERY = """
+    SELECT id, title, url, source, author, published_date, excerpt,
+           ai_summary, category, priority, tag_mask, reading_time,
+           is_read, is_starred, published_ts, priority_rank
+    FROM articles INDEXED BY idx_articles_cat_prio_date
+    WHERE category = ?
+    AND priority_rank IN ({ranks})
+    AND published_date >= datetime('now', '-7 days')
+    AND is_passed = FALSE
+    ORDER BY priority_rank DESC, published_date DESC
+    LIMIT ?
+""".format(ranks=", ".join(str(rank) for rank in sorted(set(PRIORITY_RANK.values()), reverse=True)))
+
+# Entries read from each feed
+FEED_ENTRY_LIMIT = 15
+
+# Stored article text is capped; priority, tags and reading time still see the full text
+MAX_CONTENT_CHARS = 4000
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from an element tag"""
+    return tag.rsplit('}', 1)[-1]
+
+def _parse_feed_date(value: str) -> Optional[time.struct_time]:
+    """Parse an RFC 822 or ISO 8601 feed date into a UTC struct_time like feedparser"""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return None
+    return parsed.utctimetuple()
+
+def parse_feed_stream(raw: bytes, limit: int = FEED_ENTRY_LIMIT) -> Optional[List[SimpleNamespace]]:
+    """Stream the first entries of an RSS/Atom feed with expat, or None if it can't"""
+    entries = []
+    try:
+        for _, elem in ET.iterparse(io.BytesIO(raw), events=('end',)):
+            if _local_name(elem.tag) not in ('item', 'entry'):
+                continue
+            
+            fields = {}
+            for child in elem:
+                name = _local_name(child.tag)
+                text = ''.join(child.itertext()).strip()
+                if name == 'link':
+                    # Atom links carry the URL in href; prefer the alternate link
+                    href = child.get('href')
+                    if href and child.get('rel', 'alternate') == 'alternate':
+                        fields['link'] = href
+                    elif text:
+                        fields.setdefault('link', text)
+                elif name == 'title':
+                    fields['title'] = text
+                elif name in ('description', 'summary'):
+                    fields['summary'] = text
+                elif name in ('encoded', 'content') and text:
+                    fields['content'] = [SimpleNamespace(value=text)]
+                elif name in ('author', 'creator'):
+                    atom_name = child.find('{http://www.w3.org/2005/Atom}name')
+                    fields['author'] = atom_name.text if atom_name is not None else text
+                elif name in ('pubDate', 'published', 'date', 'issued'):
+                    fields['published_parsed'] = _parse_feed_date(text)
+                elif name == 'updated':
+                    fields.setdefault('published_parsed', _parse_feed_date(text))
+            elem.clear()
+            
+            if 'link' in fields and 'title' in fields:
+                entries.append(SimpleNamespace(**fields))
+                if len(entries) >= limit:
+                    break
+    except ET.ParseError:
+        return None
+    
+    return entries or None
+
+class FeedSource(NamedTuple):
+    name: str
+    rss: str
+    priority: str
+    category: str
+
+@dataclass(slots=True, frozen=True)
 class NewsArticle:
     id: str
     title: str
@@ -43,10 +328,26 @@ class RPNewsEngine:
     
     def __init__(self, db_path: str = "rpnews.db"):
         self.db_path = db_path
+        self.db_lock = threading.RLock()
+        self.conn = self._connect()
         self.ai = RPNewsAI()
         self.session = None
-        self.sources = self._initialize_sources()
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._collection_lock = asyncio.Lock()  # one sweep at a time owns the feed state below
+        self._seen_ids: set = set()
+        self._feed_validators: Dict[str, tuple] = {}  # url -> (etag, last_modified, body_hash)
+        self._feed_schedule: Dict[str, tuple] = {}  # url -> (fetch_interval, next_fetch_ts)
+        self._subscribers: set = set()  # asyncio.Queues of connected /api/events clients
+        self.sources: Dict[str, Tuple[FeedSource, ...]] = {
+            category: tuple(FeedSource(category=category, **source) for source in sources)
+            for category, sources in self._initialize_sources().items()
+        }
+        # The source table never changes at runtime, so /api/stats and /api/health read these
+        self.source_counts = {category: len(sources) for category, sources in self.sources.items()}
+        self.source_count_total = sum(self.source_counts.values())
         self._setup_database()
+        self.status_version = 0
+        self.refresh_counters()
         self.background_task = None
         logger.info("📰 RPNews Engine initialized with open source AI")
     
@@ -56,6 +357,60 @@ class RPNewsEngine:
             self.background_task = asyncio.create_task(self.background_collection())
             logger.info("🔄 Background collection task started")
     
+    def refresh_counters(self):
+        """Reload the cached article counters and the /api/status snapshot"""
+        with self.db_lock:
+            row = self.conn.execute(COUNTERS_QUERY).fetchone()
+            self.article_count, self.read_count, self.starred_count, self.passed_count = (
+                value or 0 for value in row
+            )
+            category_counts = dict(self.conn.execute(CATEGORY_COUNTS_QUERY).fetchall())
+        
+        # Replaced wholesale so readers never see a half-built snapshot
+        self.status_version += 1
+        self.status_snapshot = {
+            **{category: category_counts.get(category, 0) for category in CATEGORIES},
+            'total': self.article_count,
+            'read': self.read_count,
+            'starred': self.starred_count,
+            'passed': self.passed_count,
+            'version': self.status_version,
+            'updated_at': datetime.now().isoformat()
+        }
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Register a listener for collection events"""
+        queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Forget a listener whose client has gone away"""
+        self._subscribers.discard(queue)
+    
+    def _publish(self, event: Dict[str, Any]):
+        """Hand an event to every listener; slow clients just miss it"""
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass
+    
+    async def open_session(self):
+        """Open the shared HTTP session used by every collection run"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=45),
+                headers={'User-Agent': 'RPNews/2.0 (+https://rpnews.com)'},
+                connector=aiohttp.TCPConnector(limit=200, limit_per_host=4, ttl_dns_cache=600, keepalive_timeout=60)
+            )
+    
+    async def close_session(self):
+        """Close the shared HTTP session on shutdown"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
     def _initialize_sources(self) -> Dict[str, List[Dict]]:
         """Complete source list - 100+ premium sources"""
         return {
@@ -155,9 +510,20 @@ class RPNewsEngine:
             ]
         }
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared WAL-mode connection used by the API handlers and the collector"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None, cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=60000")
+        return conn
+    
     def _setup_database(self):
         """Setup enhanced SQLite database with pass functionality"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS articles (
                     id TEXT PRIMARY KEY,
@@ -166,12 +532,13 @@ class RPNewsEngine:
                     source TEXT NOT NULL,
                     author TEXT,
                     published_date TIMESTAMP,
-                    content TEXT,
+                    published_ts INTEGER,
                     excerpt TEXT,
                     ai_summary TEXT,
                     category TEXT,
                     priority TEXT,
-                    tags TEXT,
+                    priority_rank INTEGER DEFAULT 1,
+                    tag_mask INTEGER DEFAULT 0,
                     reading_time INTEGER DEFAULT 0,
                     extracted_at TIMESTAMP,
                     is_read BOOLEAN DEFAULT FALSE,
@@ -183,6 +550,16 @@ class RPNewsEngine:
                 )
             """)
             
+            had_bodies = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_bodies'"
+            ).fetchone()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS article_bodies (
+                    id TEXT PRIMARY KEY,
+                    content BLOB
+                )
+            """)
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS collection_stats (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -204,54 +581,95 @@ class RPNewsEngine:
                 )
             """)
             
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feed_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body_hash TEXT,
+                    last_fetched TIMESTAMP,
+                    fetch_interval INTEGER DEFAULT 3600,
+                    next_fetch_ts INTEGER DEFAULT 0
+                )
+            """)
+            
+            # Older databases predate the priority_rank column
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+            if 'priority_rank' not in columns:
+                conn.execute("ALTER TABLE articles ADD COLUMN priority_rank INTEGER DEFAULT 1")
+                conn.execute("""
+                    UPDATE articles SET priority_rank = CASE priority 
+                        WHEN 'high' THEN 3 
+                        WHEN 'medium' THEN 2 
+                        ELSE 1 
+                    END
+                """)
+            
+            # Epoch seconds let handlers compute ages with integer math
+            if 'published_ts' not in columns:
+                conn.execute("ALTER TABLE articles ADD COLUMN published_ts INTEGER")
+                conn.execute("UPDATE articles SET published_ts = CAST(strftime('%s', published_date, 'utc') AS INTEGER)")
+            
+            # Adaptive scheduling columns were added to feed_cache later
+            feed_columns = {row[1] for row in conn.execute("PRAGMA table_info(feed_cache)")}
+            if 'fetch_interval' not in feed_columns:
+                conn.execute(f"ALTER TABLE feed_cache ADD COLUMN fetch_interval INTEGER DEFAULT {DEFAULT_FETCH_INTERVAL}")
+                conn.execute("ALTER TABLE feed_cache ADD COLUMN next_fetch_ts INTEGER DEFAULT 0")
+            if 'body_hash' not in feed_columns:
+                conn.execute("ALTER TABLE feed_cache ADD COLUMN body_hash TEXT")
+            
+            # Tags used to be stored as JSON text
+            if 'tag_mask' not in columns:
+                conn.execute("ALTER TABLE articles ADD COLUMN tag_mask INTEGER DEFAULT 0")
+                rows = conn.execute("SELECT id, tags FROM articles WHERE tags IS NOT NULL").fetchall()
+                conn.executemany(
+                    "UPDATE articles SET tag_mask = ?, tags = NULL WHERE id = ?",
+                    [(encode_tags(orjson.loads(tags)), article_id) for article_id, tags in rows]
+                )
+            
+            # Article text used to sit inline in articles.content
+            if not had_bodies and 'content' in columns:
+                rows = conn.execute("SELECT id, content FROM articles WHERE content IS NOT NULL").fetchall()
+                conn.executemany(INSERT_BODY_QUERY, [(article_id, zlib.compress(content.encode())) for article_id, content in rows])
+                conn.execute("UPDATE articles SET content = NULL WHERE content IS NOT NULL")
+            
             # Performance indexes
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_category ON articles(category)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_published ON articles(published_date)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_priority ON articles(priority)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_read_starred ON articles(is_read, is_starred)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_passed ON articles(is_passed)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_cat_prio_date ON articles(category, priority_rank DESC, published_date DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_cat_date ON articles(category, published_date DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_published_ts ON articles(published_ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_priority_high ON articles(category, published_date DESC) WHERE priority = 'high'")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_unread ON articles(priority_rank DESC, published_date DESC) WHERE is_read = FALSE AND is_passed = FALSE")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_starred ON articles(starred_at DESC) WHERE is_starred = TRUE")
+            
+            # Covered by the composites above (category) or too unselective to help (priority)
+            conn.execute("DROP INDEX IF EXISTS idx_category")
+            conn.execute("DROP INDEX IF EXISTS idx_priority")
+        
+        # Give the planner statistics for the indexes above
+        with self.db_lock:
+            self.conn.execute("ANALYZE")
     
     def _calculate_priority(self, title: str, content: str, source_priority: str, category: str) -> str:
         """Enhanced priority detection based on content analysis"""
-        priority_score = 0
         text = f"{title} {content}".lower()
         
         # Base score from source priority
-        priority_base = {"high": 3, "medium": 2, "low": 1}
-        priority_score = priority_base.get(source_priority, 2)
-        
-        # Category-specific high-priority indicators
-        high_priority_terms = {
-            'ai': [
-                'breakthrough', 'released', 'announces', 'launches', 'gpt-', 'claude',
-                'funding round', 'acquisition', 'partnership', 'regulation', 'banned',
-                'agi', 'superintelligence', '$', 'billion', 'million funding'
-            ],
-            'finance': [
-                'fed decision', 'interest rate', 'inflation', 'recession', 'crash',
-                'bank failure', 'earnings beat', 'guidance', 'outlook', 'upgraded',
-                'downgraded', 'merger', 'acquisition', 'ipo', 'bankruptcy'
-            ],
-            'politics': [
-                'breaking', 'urgent', 'senate votes', 'house passes', 'president',
-                'supreme court', 'indictment', 'investigation', 'scandal',
-                'election results', 'poll', 'debate', 'resignation', 'appointed'
-            ]
-        }
-        
-        category_terms = high_priority_terms.get(category, [])
+        priority_score = PRIORITY_RANK.get(source_priority, 2)
         
         # Count high-priority term matches
+        category_terms = HIGH_PRIORITY_TERMS.get(category, ())
         term_matches = sum(1 for term in category_terms if term in text)
         priority_score += min(term_matches * 0.5, 2)  # Max 2 bonus points
         
         # Boost for numbers/percentages (usually important data)
-        if re.search(r'\d+%|\$\d+\.?\d*[bmk]|\d+\.\d+%', text):
+        if DATA_POINT_PATTERN.search(text):
             priority_score += 0.5
         
         # Boost for urgency words
-        urgency_terms = ['breaking', 'urgent', 'just in', 'developing', 'alert']
-        if any(term in text for term in urgency_terms):
+        if URGENCY_PATTERN.search(text):
             priority_score += 1
         
         # Determine final priority
@@ -288,13 +706,8 @@ class RPNewsEngine:
         # Initial collection on startup
         if await self._has_network():
             try:
-                async with aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=45),
-                    headers={'User-Agent': 'RPNews/2.0 (+https://rpnews.com)'}
-                ) as session:
-                    self.session = session
-                    await self.collect_all_news()
-                    self.session = None
+                await self.open_session()
+                await self.collect_all_news()
                 logger.info("✅ Initial collection completed")
             except Exception as e:
                 logger.error(f"Initial collection error: {e}")
@@ -304,52 +717,138 @@ class RPNewsEngine:
         # Continue with regular collection cycle
         while True:
             try:
-                await asyncio.sleep(3600)  # Wait 1 hour
+                await asyncio.sleep(MIN_FETCH_INTERVAL)  # Feeds that aren't due yet are skipped
 
                 if not await self._has_network():
                     logger.warning("🌐 Network unavailable - skipping background collection")
                     continue
 
                 logger.info("🔄 Background collection starting...")
-                async with aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=30),
-                    headers={'User-Agent': 'RPNews/2.0 (+https://rpnews.com)'}
-                ) as session:
-                    self.session = session
-                    await self.collect_all_news()
-                    self.session = None
+                await self.open_session()
+                await self.collect_all_news()
 
-                logger.info("✅ Background collection complete. Next run in 1 hour.")
+                logger.info(f"✅ Background collection complete. Next check in {MIN_FETCH_INTERVAL // 60} minutes.")
 
             except Exception as e:
                 logger.error(f"Background collection error: {str(e)}")
                 await asyncio.sleep(600)  # Wait 10 minutes on error
     
-    async def collect_all_news(self):
-        """Enhanced news collection with better processing"""
-        total_articles = 0
-        
-        for category in ['ai', 'finance', 'politics']:
-            try:
-                count = await self.collect_category(category)
+    async def collect_all_news(self, force: bool = False):
+        """Collect every feed that is due, or every feed when forced"""
+        # A manual refresh during a background sweep waits here instead of swapping out the
+        # seen ids, validators and schedules the running sweep is still reading and writing
+        async with self._collection_lock:
+            total_articles = 0
+            self._seen_ids = await asyncio.to_thread(self._load_seen_ids)
+            self._feed_validators = await asyncio.to_thread(self._load_feed_validators)
+            self._feed_schedule = await asyncio.to_thread(self._load_feed_schedule)
+            
+            # Categories share the per-host locks, so running them together stays polite
+            results = await asyncio.gather(
+                *(self.collect_category(category, force) for category in CATEGORIES),
+                return_exceptions=True
+            )
+            
+            for category, count in zip(CATEGORIES, results):
+                if isinstance(count, Exception):
+                    logger.error(f"Error collecting {category}: {str(count)}")
+                    continue
                 total_articles += count
-                
+            
                 # Update stats
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.execute("""
-                        INSERT INTO collection_stats 
-                        (category, articles_collected, last_run, status)
-                        VALUES (?, ?, ?, ?)
-                    """, (category, count, datetime.now(), 'success'))
-                
-            except Exception as e:
-                logger.error(f"Error collecting {category}: {str(e)}")
+                await asyncio.to_thread(self._record_collection, category, count)
+            
+            # Generate daily overview after collection
+            if total_articles or force:
+                await self._generate_daily_overview()
+            # An empty pass changes nothing, so keep cache keys and connected dashboards as they are
+            if total_articles:
+                await asyncio.to_thread(self._optimize_database)
+                await asyncio.to_thread(self.refresh_counters)
+                self._publish({'type': 'collection', 'collected': total_articles, 'status': self.status_snapshot})
+            
+            logger.info(f"✅ Total articles collected: {total_articles}")
+            return total_articles
+    
+    def _optimize_database(self):
+        """Refresh planner statistics for tables that changed enough to need it"""
+        with self.db_lock:
+            self.conn.execute("PRAGMA optimize")
+    
+    def _load_seen_ids(self) -> set:
+        """Load the ids of recent articles so feeds can skip them without a query"""
+        with self.db_lock:
+            return {row[0] for row in self.conn.execute(SEEN_IDS_QUERY)}
+    
+    def _load_feed_validators(self) -> Dict[str, tuple]:
+        """Load stored ETag/Last-Modified values and body hashes for conditional feed requests"""
+        with self.db_lock:
+            return {url: (etag, last_modified, body_hash) for url, etag, last_modified, body_hash
+                    in self.conn.execute("SELECT url, etag, last_modified, body_hash FROM feed_cache")}
+    
+    def _load_feed_schedule(self) -> Dict[str, tuple]:
+        """Load each feed's refresh interval and next due time"""
+        with self.db_lock:
+            return {url: (fetch_interval, next_fetch_ts) for url, fetch_interval, next_fetch_ts
+                    in self.conn.execute("SELECT url, fetch_interval, next_fetch_ts FROM feed_cache")}
+    
+    def _save_feed_cache(self, pending: Dict[str, tuple], schedule: Dict[str, tuple]):
+        """Persist one category's validators and schedules once its articles have been saved"""
+        if not pending and not schedule:
+            return
         
-        # Generate daily overview after collection
-        await self._generate_daily_overview()
+        now = datetime.now()
+        with self._transaction() as conn:
+            conn.executemany("""
+                INSERT INTO feed_cache (url, etag, last_modified, body_hash, last_fetched)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    body_hash = excluded.body_hash,
+                    last_fetched = excluded.last_fetched
+            """, [(url, etag, last_modified, body_hash, now)
+                  for url, (etag, last_modified, body_hash) in pending.items()])
+            conn.executemany("""
+                INSERT INTO feed_cache (url, fetch_interval, next_fetch_ts)
+                VALUES (?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    fetch_interval = excluded.fetch_interval,
+                    next_fetch_ts = excluded.next_fetch_ts
+            """, [(url, fetch_interval, next_fetch_ts) for url, (fetch_interval, next_fetch_ts) in schedule.items()])
+    
+    def _record_collection(self, category: str, count: int):
+        """Append a collection_stats row for a finished category run"""
+        with self.db_lock:
+            self.conn.execute("""
+                INSERT INTO collection_stats 
+                (category, articles_collected, last_run, status)
+                VALUES (?, ?, ?, ?)
+            """, (category, count, datetime.now(), 'success'))
+    
+    def _load_overview_articles(self) -> Dict[str, List[Dict]]:
+        """Today's top articles per category for the daily overview"""
+        with self.db_lock:
+            rows = self.conn.execute(OVERVIEW_ARTICLES_QUERY).fetchall()
         
-        logger.info(f"✅ Total articles collected: {total_articles}")
-        return total_articles
+        articles_by_category = {category: [] for category in CATEGORIES}
+        for category, title, ai_summary, priority in rows:
+            articles_by_category[category].append({
+                'title': title,
+                'aiSummary': ai_summary,
+                'priority': priority
+            })
+        
+        return articles_by_category
+    
+    def _store_daily_overview(self, today: str, overview_text: str, total_articles: int, high_priority_count: int):
+        """Save the overview for a date, replacing an earlier one"""
+        with self.db_lock:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO daily_overviews 
+                (date, overview_text, total_articles, high_priority_count, generated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (today, overview_text, total_articles, high_priority_count, datetime.now()))
     
     async def _generate_daily_overview(self):
         """Generate and store daily overview"""
@@ -357,232 +856,286 @@ class RPNewsEngine:
         
         try:
             # Get today's articles by category
-            articles_by_category = {}
+            articles_by_category = await asyncio.to_thread(self._load_overview_articles)
             
-            with sqlite3.connect(self.db_path) as conn:
-                for category in ['ai', 'finance', 'politics']:
-                    cursor = conn.execute("""
-                        SELECT title, ai_summary, priority FROM articles 
-                        WHERE category = ? AND date(published_date) = date('now')
-                        ORDER BY 
-                            CASE priority 
-                                WHEN 'high' THEN 3 
-                                WHEN 'medium' THEN 2 
-                                ELSE 1 
-                            END DESC
-                        LIMIT 10
-                    """, (category,))
-                    
-                    articles = []
-                    for row in cursor.fetchall():
-                        articles.append({
-                            'title': row[0],
-                            'aiSummary': row[1],
-                            'priority': row[2]
-                        })
-                    
-                    articles_by_category[category] = articles
-                
-                # Generate overview
-                overview_text = self.ai.generate_daily_overview(articles_by_category)
-                
-                total_articles = sum(len(articles) for articles in articles_by_category.values())
-                high_priority_count = sum(
-                    len([a for a in articles if a.get('priority') == 'high']) 
-                    for articles in articles_by_category.values()
-                )
-                
-                # Store overview
-                conn.execute("""
-                    INSERT OR REPLACE INTO daily_overviews 
-                    (date, overview_text, total_articles, high_priority_count, generated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (today, overview_text, total_articles, high_priority_count, datetime.now()))
-                
-                logger.info(f"📊 Daily overview generated: {total_articles} articles, {high_priority_count} high priority")
+            # Generate overview; the Ollama request or model run would otherwise stall the loop
+            overview_text = await asyncio.to_thread(self.ai.generate_daily_overview, articles_by_category)
+            
+            total_articles = sum(len(articles) for articles in articles_by_category.values())
+            high_priority_count = sum(
+                len([a for a in articles if a.get('priority') == 'high']) 
+                for articles in articles_by_category.values()
+            )
+            
+            # Store overview
+            await asyncio.to_thread(self._store_daily_overview, today, overview_text, total_articles, high_priority_count)
+            
+            logger.info(f"📊 Daily overview generated: {total_articles} articles, {high_priority_count} high priority")
                 
         except Exception as e:
             logger.error(f"Error generating daily overview: {e}")
     
-    async def collect_category(self, category: str) -> int:
+    async def collect_category(self, category: str, force: bool = False) -> int:
         """Enhanced category collection with better AI processing"""
-        sources = self.sources.get(category, [])
-        total_articles = 0
+        sources = self.sources.get(category, ())
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        # Validators and schedules stay with this category until its own save succeeds; a failure discards them
+        validators: Dict[str, tuple] = {}
+        schedule: Dict[str, tuple] = {}
         
-        for source in sources:
-            try:
-                articles = await self.fetch_rss_feed(source, category)
-                for article in articles:
-                    self.save_article(article)
-                    total_articles += 1
-                
-                # Rate limiting - be respectful
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.warning(f"Error with {source['name']}: {str(e)}")
+        results = await asyncio.gather(
+            *(self._fetch_source(semaphore, source, category, validators, schedule, force) for source in sources),
+            return_exceptions=True
+        )
+        
+        collected = []
+        for source, articles in zip(sources, results):
+            if isinstance(articles, Exception):
+                logger.warning(f"Error with {source.name}: {str(articles)}")
                 continue
+            collected.extend(articles)
+        
+        # Feeds parse in parallel threads, but the model runs once per category rather than once per feed
+        collected = await asyncio.to_thread(self._summarize_articles, collected)
+        total_articles = await asyncio.to_thread(self.save_articles, collected)
+        await asyncio.to_thread(self._save_feed_cache, validators, schedule)
         
         logger.info(f"Collected {total_articles} {category} articles")
         return total_articles
     
-    async def fetch_rss_feed(self, source: Dict[str, str], category: str) -> List[NewsArticle]:
-        """Enhanced RSS feed processing with better content extraction"""
+    async def _fetch_source(self, semaphore: asyncio.Semaphore, source: FeedSource, category: str,
+                            validators: Dict[str, tuple], schedule: Dict[str, tuple],
+                            force: bool = False) -> List[NewsArticle]:
+        """Fetch one feed if it is due, spacing out requests that go to the same host"""
+        fetch_interval, next_fetch_ts = self._feed_schedule.get(source.rss, (DEFAULT_FETCH_INTERVAL, 0))
+        if not force and time.time() < next_fetch_ts:
+            return []
+        
+        host = urlparse(source.rss).netloc
+        host_lock = self._host_locks.setdefault(host, asyncio.Lock())
+        
+        async with host_lock:
+            async with semaphore:
+                articles = await self.fetch_rss_feed(source, category, validators, force)
+            
+            # Rate limiting - be respectful to each host
+            await asyncio.sleep(HOST_DELAY_SECONDS)
+        
+        # A failed fetch says nothing about how busy the feed is: keep its interval, retry next sweep
+        if articles is None:
+            schedule[source.rss] = (fetch_interval, int(time.time()) + MIN_FETCH_INTERVAL)
+            return []
+        
+        # Back off feeds that had nothing new, check busy ones more often
+        if not articles:
+            fetch_interval = min(fetch_interval * 2, MAX_FETCH_INTERVAL)
+        elif len(articles) >= BUSY_FEED_NEW_ITEMS:
+            fetch_interval = max(fetch_interval // 2, MIN_FETCH_INTERVAL)
+        schedule[source.rss] = (fetch_interval, int(time.time()) + fetch_interval)
+        
+        return articles
+    
+    async def fetch_rss_feed(self, source: FeedSource, category: str,
+                             validators: Optional[Dict[str, tuple]] = None,
+                             force: bool = False) -> Optional[List[NewsArticle]]:
+        """Fetch and parse one feed, recording its new validators in `validators` once parsed; None on errors"""
         articles = []
         
         try:
-            async with self.session.get(source['rss']) as response:
+            # Conditional GET so unchanged feeds answer 304 with no body; a forced run re-reads
+            # everything so it can recover articles whose save failed after their validators were stored
+            headers = {}
+            stored = (None, None, None) if force else self._feed_validators.get(source.rss, (None, None, None))
+            etag, last_modified, body_hash = stored
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+            
+            async with self.session.get(source.rss, headers=headers) as response:
+                if response.status == 304:
+                    return articles
                 if response.status != 200:
+                    logger.warning(f"⚠️ {source.name} answered HTTP {response.status}")
+                    return None
+                
+                raw = await response.read()
+                
+                # Servers without validators still resend identical bodies; skip parsing those
+                digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+                if digest == body_hash:
                     return articles
                 
-                content = await response.text()
-                feed = feedparser.parse(content)
+                fresh_validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'), digest)
+            
+            # Parsing, cleanup and summarising are CPU/blocking work; keep them off the loop
+            articles = await asyncio.to_thread(self._parse_feed, raw, source, category)
+            if validators is not None:
+                validators[source.rss] = fresh_validators
                 
-                for entry in feed.entries[:15]:  # Increased limit per source
-                    try:
-                        article_id = hashlib.md5(entry.link.encode()).hexdigest()
-                        
-                        # Skip if already exists
-                        if self._article_exists(article_id):
-                            continue
-                        
-                        # Parse published date
-                        published_date = datetime.now()
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            published_date = datetime(*entry.published_parsed[:6])
-                        
-                        # Extract and clean content
-                        content = getattr(entry, 'summary', '')
-                        if hasattr(entry, 'content'):
-                            content = entry.content[0].value if entry.content else content
-                        
-                        if content:
-                            soup = BeautifulSoup(content, 'html.parser')
-                            content = soup.get_text().strip()
-                        
-                        # Enhanced priority detection
-                        priority = self._calculate_priority(entry.title, content, source['priority'], category)
-                        
-                        # Calculate reading time
-                        reading_time = self._calculate_reading_time(content)
-                        
-                        # Generate excerpt and AI summary
-                        excerpt = content[:400] + "..." if len(content) > 400 else content
-                        ai_summary = self.ai.generate_summary(entry.title, content[:2000], category)
-                        
-                        # Extract tags
-                        tags = self._extract_tags(entry.title, content, category)
-                        
-                        article = NewsArticle(
-                            id=article_id,
-                            title=entry.title.strip(),
-                            url=entry.link,
-                            source=source['name'],
-                            author=getattr(entry, 'author', None),
-                            published_date=published_date,
-                            content=content,
-                            excerpt=excerpt,
-                            ai_summary=ai_summary,
-                            category=category,
-                            priority=priority,
-                            tags=tags,
-                            reading_time=reading_time,
-                            extracted_at=datetime.now()
-                        )
-                        
-                        articles.append(article)
-                        
-                    except Exception as e:
-                        logger.warning(f"Error processing article from {source['name']}: {str(e)}")
-                        continue
-                        
         except Exception as e:
-            logger.error(f"Error fetching {source['name']}: {str(e)}")
+            logger.error(f"Error fetching {source.name}: {str(e)}")
+            return None
         
         return articles
     
-    def _article_exists(self, article_id: str) -> bool:
-        """Check if article already exists"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT 1 FROM articles WHERE id = ?", (article_id,))
-            return cursor.fetchone() is not None
+    def _parse_feed(self, raw: bytes, source: FeedSource, category: str) -> List[NewsArticle]:
+        """Turn a downloaded feed body into new articles, left unsummarized for collect_category"""
+        articles = []
+        
+        # Stream well-formed feeds; feedparser handles anything unusual
+        entries = parse_feed_stream(raw)
+        if entries is None:
+            # feedparser reads the encoding from the XML prolog itself
+            entries = feedparser.parse(raw).entries[:FEED_ENTRY_LIMIT]
+        
+        for entry in entries:
+            try:
+                article_id = hashlib.md5(entry.link.encode()).hexdigest()
+                
+                # Skip if already exists
+                if article_id in self._seen_ids:
+                    continue
+                self._seen_ids.add(article_id)
+                
+                # Parse published date
+                published_date = datetime.now()
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    published_date = datetime(*entry.published_parsed[:6])
+                
+                # Extract and clean content
+                content = getattr(entry, 'summary', '')
+                if hasattr(entry, 'content'):
+                    content = entry.content[0].value if entry.content else content
+                
+                if content:
+                    content = self._strip_html(content)
+                
+                # Enhanced priority detection
+                priority = self._calculate_priority(entry.title, content, source.priority, category)
+                
+                # Calculate reading time
+                reading_time = self._calculate_reading_time(content)
+                
+                # Extract tags
+                tags = self._extract_tags(entry.title, content, category)
+                
+                # Nothing downstream reads further than this, so only keep this much
+                content = content[:MAX_CONTENT_CHARS]
+                
+                # Generate excerpt; summaries are produced for the whole category afterwards
+                excerpt = content[:400] + "..." if len(content) > 400 else content
+                
+                articles.append(NewsArticle(
+                    id=article_id,
+                    title=entry.title.strip(),
+                    url=entry.link,
+                    source=source.name,
+                    author=getattr(entry, 'author', None),
+                    published_date=published_date,
+                    content=content,
+                    excerpt=excerpt,
+                    ai_summary=None,
+                    category=category,
+                    priority=priority,
+                    tags=tags,
+                    reading_time=reading_time,
+                    extracted_at=datetime.now()
+                ))
+                
+            except Exception as e:
+                logger.warning(f"Error processing article from {source.name}: {str(e)}")
+                continue
+        
+        return articles
+    
+    def _summarize_articles(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        """Fill in AI summaries for a category's new articles with one batched model call"""
+        summaries = self.ai.summarize_batch(
+            [(article.title, article.content[:2000], article.category) for article in articles]
+        )
+        return [replace(article, ai_summary=summary) for article, summary in zip(articles, summaries)]
+    
+    def _strip_html(self, content: str) -> str:
+        """Reduce feed HTML to plain text with selectolax's C parser"""
+        # Many feeds already ship plain text; only entities need decoding then
+        if '<' not in content:
+            return html.unescape(content).strip()
+        tree = HTMLParser(content)
+        tree.strip_tags(['script', 'style'])
+        return tree.text().strip()
     
     def _extract_tags(self, title: str, content: str, category: str) -> List[str]:
         """Enhanced tag extraction with better categorization"""
         text = f"{title} {content}".lower()
         tags = []
         
-        # Category-specific tag extraction
-        if category == "ai":
-            ai_terms = {
-                'gpt': ['gpt', 'chatgpt', 'gpt-4', 'gpt-3'],
-                'llm': ['language model', 'llm', 'large language'],
-                'ml': ['machine learning', 'deep learning', 'neural network'],
-                'startup': ['startup', 'funding', 'investment', 'series a', 'series b'],
-                'research': ['paper', 'research', 'arxiv', 'study', 'journal'],
-                'robotics': ['robot', 'robotics', 'autonomous'],
-                'computer_vision': ['computer vision', 'image recognition', 'cv'],
-                'nlp': ['natural language', 'nlp', 'text processing'],
-                'ethics': ['ethics', 'bias', 'fairness', 'responsible ai']
-            }
-        elif category == "finance":
-            ai_terms = {
-                'crypto': ['bitcoin', 'cryptocurrency', 'crypto', 'ethereum'],
-                'stocks': ['stock', 'equity', 'shares', 'nasdaq', 'sp500'],
-                'fed': ['federal reserve', 'fed', 'interest rate', 'fomc'],
-                'market': ['market', 'trading', 'dow jones'],
-                'banking': ['bank', 'banking', 'credit', 'loan'],
-                'inflation': ['inflation', 'cpi', 'consumer price'],
-                'earnings': ['earnings', 'revenue', 'profit', 'quarterly'],
-                'ipo': ['ipo', 'public offering', 'listing'],
-                'merger': ['merger', 'acquisition', 'm&a']
-            }
-        else:  # politics
-            ai_terms = {
-                'congress': ['congress', 'senate', 'house', 'representatives'],
-                'election': ['election', 'vote', 'campaign', 'ballot'],
-                'policy': ['policy', 'legislation', 'bill', 'law'],
-                'international': ['international', 'foreign', 'diplomatic'],
-                'supreme_court': ['supreme court', 'scotus', 'judicial'],
-                'presidency': ['president', 'white house', 'administration'],
-                'healthcare': ['healthcare', 'medicare', 'medicaid'],
-                'economy': ['economic', 'fiscal', 'budget'],
-                'climate': ['climate', 'environmental', 'green energy']
-            }
-            
-        for tag, keywords in ai_terms.items():
-            if any(keyword in text for keyword in keywords):
+        for tag, pattern in TAG_PATTERNS.get(category, TAG_PATTERNS['politics']):
+            if pattern.search(text):
                 tags.append(tag)
         
         return tags[:8]  # Limit to 8 tags
     
+    @contextmanager
+    def _transaction(self):
+        """Run a block of writes on the shared connection as one transaction"""
+        with self.db_lock:
+            # Take the write lock up front so another process can't force a busy upgrade mid-transaction
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+                self.conn.execute("COMMIT")
+            except BaseException:
+                # A failed COMMIT (e.g. SQLITE_BUSY) leaves the transaction open; don't leak it
+                if self.conn.in_transaction:
+                    self.conn.execute("ROLLBACK")
+                raise
+    
+    def save_articles(self, articles: List[NewsArticle]) -> int:
+        """Insert a batch of articles in one transaction, returning how many were new"""
+        if not articles:
+            return 0
+        
+        rows = [(
+            article.id, article.title, article.url, article.source, article.author,
+            article.published_date, int(article.published_date.timestamp()), article.excerpt, article.ai_summary,
+            article.category, article.priority, PRIORITY_RANK.get(article.priority, 1),
+            encode_tags(article.tags),
+            article.reading_time, article.extracted_at
+        ) for article in articles]
+        bodies = [(article.id, zlib.compress(article.content.encode())) for article in articles]
+        
+        with self._transaction() as conn:
+            changes_before = conn.total_changes
+            conn.executemany(INSERT_ARTICLE_QUERY, rows)
+            inserted = conn.total_changes - changes_before
+            conn.executemany(INSERT_BODY_QUERY, bodies)
+            self.article_count += inserted
+        return inserted
+    
     def save_article(self, article: NewsArticle):
         """Enhanced article saving with new fields"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO articles 
-                (id, title, url, source, author, published_date, content, excerpt,
-                 ai_summary, category, priority, tags, reading_time, extracted_at,
-                 is_read, is_starred, is_passed)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, FALSE, FALSE, FALSE)
-            """, (
-                article.id, article.title, article.url, article.source, article.author,
-                article.published_date, article.content, article.excerpt, article.ai_summary,
-                article.category, article.priority, json.dumps(article.tags), 
-                article.reading_time, article.extracted_at
-            ))
+        self.save_articles([article])
+    
+    def get_article_content(self, article_id: str) -> Optional[str]:
+        """Decompress one article's stored text; list endpoints never touch it"""
+        with self.db_lock:
+            row = self.conn.execute("SELECT content FROM article_bodies WHERE id = ?", (article_id,)).fetchone()
+        return zlib.decompress(row[0]).decode() if row else None
     
     def mark_article_read(self, article_id: str, is_read: bool = True) -> bool:
         """Mark article as read or unread"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db_lock:
                 read_at = datetime.now() if is_read else None
-                conn.execute("""
+                cursor = self.conn.execute("""
                     UPDATE articles 
                     SET is_read = ?, read_at = ? 
-                    WHERE id = ?
-                """, (is_read, read_at, article_id))
-                return True
+                    WHERE id = ? AND is_read != ?
+                """, (is_read, read_at, article_id, is_read))
+                if cursor.rowcount:
+                    self.read_count += 1 if is_read else -1
+            return True
         except Exception as e:
             logger.error(f"Error marking article read: {e}")
             return False
@@ -590,14 +1143,16 @@ class RPNewsEngine:
     def star_article(self, article_id: str, starred: bool = True) -> bool:
         """Star or unstar an article"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.db_lock:
                 starred_at = datetime.now() if starred else None
-                conn.execute("""
+                cursor = self.conn.execute("""
                     UPDATE articles 
                     SET is_starred = ?, starred_at = ? 
-                    WHERE id = ?
-                """, (starred, starred_at, article_id))
-                return True
+                    WHERE id = ? AND is_starred != ?
+                """, (starred, starred_at, article_id, starred))
+                if cursor.rowcount:
+                    self.starred_count += 1 if starred else -1
+            return True
         except Exception as e:
             logger.error(f"Error starring article: {e}")
             return False
@@ -605,13 +1160,15 @@ class RPNewsEngine:
     def pass_article(self, article_id: str) -> bool:
         """Pass/dismiss an article"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+            with self.db_lock:
+                cursor = self.conn.execute("""
                     UPDATE articles 
                     SET is_passed = TRUE, passed_at = ? 
-                    WHERE id = ?
+                    WHERE id = ? AND is_passed = FALSE
                 """, (datetime.now(), article_id))
-                return True
+                if cursor.rowcount:
+                    self.passed_count += 1
+            return True
         except Exception as e:
             logger.error(f"Error passing article: {e}")
             return False
@@ -619,67 +1176,24 @@ class RPNewsEngine:
     def get_articles_for_briefing(self, limit: int = 100) -> Dict[str, List]:
         """Get articles for daily briefing with proper distribution"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                briefing = {}
-                
-                # Calculate articles per category (aim for roughly equal distribution)
-                articles_per_category = limit // 3
-                
-                for category in ['ai', 'finance', 'politics']:
-                    cursor = conn.execute("""
-                        SELECT id, title, url, source, author, published_date, excerpt,
-                               ai_summary, priority, tags, reading_time, is_read, is_starred
-                        FROM articles 
-                        WHERE category = ? 
-                        AND is_passed = FALSE 
-                        AND published_date >= datetime('now', '-7 days')
-                        ORDER BY 
-                            CASE priority 
-                                WHEN 'high' THEN 3 
-                                WHEN 'medium' THEN 2 
-                                ELSE 1 
-                            END DESC,
-                            published_date DESC
-                        LIMIT ?
-                    """, (category, articles_per_category))
-                    
-                    articles = []
-                    for row in cursor.fetchall():
-                        # Calculate time ago
-                        try:
-                            pub_date = datetime.fromisoformat(row[5])
-                            hours_ago = int((datetime.now() - pub_date).total_seconds() / 3600)
-                            if hours_ago < 1:
-                                time_str = "Just now"
-                            elif hours_ago < 24:
-                                time_str = f"{hours_ago}h ago"
-                            else:
-                                days_ago = hours_ago // 24
-                                time_str = f"{days_ago}d ago"
-                        except:
-                            time_str = "Recently"
-                        
-                        articles.append({
-                            'id': row[0],
-                            'title': row[1],
-                            'url': row[2],
-                            'source': row[3],
-                            'author': row[4] or 'Unknown',
-                            'publishedDate': row[5],
-                            'excerpt': row[6],
-                            'aiSummary': row[7],
-                            'priority': row[8],
-                            'tags': json.loads(row[9] or '[]'),
-                            'readingTime': row[10] or 2,
-                            'category': category,
-                            'timeAgo': time_str,
-                            'isRead': bool(row[11]),
-                            'isStarred': bool(row[12])
-                        })
-                    
-                    briefing[category] = articles
-                
-                return briefing
+            # Calculate articles per category (aim for roughly equal distribution)
+            articles_per_category = limit // 3
+            
+            # One index-ordered query per category, all under a single lock hold
+            with self.db_lock:
+                rows = [
+                    row
+                    for category in CATEGORIES
+                    for row in self.conn.execute(BRIEFING_QUERY, (category, articles_per_category))
+                ]
+            
+            briefing = {'ai': [], 'finance': [], 'politics': []}
+            now_ts = int(time.time())
+            for row in rows:
+                article = row_to_article(row, now_ts)
+                briefing[article['category']].append(article)
+            
+            return briefing
                 
         except Exception as e:
             logger.error(f"Error getting briefing articles: {e}")
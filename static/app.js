@@ -3,14 +3,106 @@
 let currentData = null;
 let currentView = 'briefing';
 let currentFilter = 'all';
+let briefingHtml = null; // server-rendered cards for the unfiltered briefing
+
+// Shared by every renderer; frozen so its shape never changes
+const CATEGORIES = Object.freeze([
+    Object.freeze({ key: 'ai', title: 'AI & Technology', icon: 'AI' }),
+    Object.freeze({ key: 'finance', title: 'Finance & Markets', icon: 'FIN' }),
+    Object.freeze({ key: 'politics', title: 'Politics & Policy', icon: 'POL' })
+]);
+
+const EMPTY_FILTER_HTML = '<div class="empty-state"><div class="empty-state-icon">∅</div><h3>No articles match current filters</h3><p>Try adjusting your filters or refresh to collect the latest news.</p></div>';
 
 // Initialize
 document.addEventListener('DOMContentLoaded', function() {
     loadBriefing();
     setupNavigation();
     setupFilters();
+    setupCardActions();
+    listenForCollections();
 });
 
+function setupCardActions() {
+    // Cards carry their id and URL in data attributes; one delegated listener handles every button
+    document.getElementById('news-content').addEventListener('click', event => {
+        const target = event.target.closest('[data-action]');
+        const card = target && target.closest('.article-card');
+        if (!card) return;
+        
+        const { id, url } = card.dataset;
+        switch (target.dataset.action) {
+            case 'read': markAsRead(id, target); break;
+            case 'star': toggleStar(id, target); break;
+            case 'pass': passArticle(id, target); break;
+            case 'open': openArticle(url, target); break;
+        }
+    });
+}
+
+function listenForCollections() {
+    if (!window.EventSource) return;
+    
+    // The server pushes an event when a collection finishes, so there is nothing to poll
+    let events = null;
+    let hiddenVersion = null;
+    const connect = () => {
+        events = new EventSource('/api/events');
+        events.addEventListener('collection', event => {
+            // Re-rendering resets scroll position, so only do it when articles actually arrived
+            if (JSON.parse(event.data).collected > 0) reloadBriefingQuietly();
+        });
+    };
+    
+    // Background tabs drop the stream; on return, reload only if the data moved on meanwhile
+    document.addEventListener('visibilitychange', async () => {
+        if (document.hidden) {
+            events.close();
+            hiddenVersion = await fetchStatusVersion();
+        } else {
+            connect();
+            const version = await fetchStatusVersion();
+            if (version !== null && version !== hiddenVersion) reloadBriefingQuietly();
+        }
+    });
+    connect();
+}
+
+async function fetchStatusVersion() {
+    try {
+        const response = await fetch('/api/status');
+        return response.ok ? (await response.json()).version : null;
+    } catch (error) {
+        return null;
+    }
+}
+
+// The server-rendered cards are only shown for the unfiltered briefing view;
+// everywhere else the JSON is rendered client-side, so skip the fragment request
+function showsBriefingHtml() {
+    return currentView === 'briefing' && currentFilter === 'all';
+}
+
+async function reloadBriefingQuietly() {
+    try {
+        const [response, htmlResponse] = await Promise.all([
+            fetch('/api/morning-briefing'),
+            showsBriefingHtml() ? fetch('/api/morning-briefing.html') : null
+        ]);
+        if (!response.ok) return;
+        
+        currentData = await response.json();
+        briefingHtml = htmlResponse && htmlResponse.ok ? await htmlResponse.text() : null;
+        
+        // Lists with their own endpoints are left alone until the user revisits them
+        if (currentView !== 'reading-list' && currentView !== 'starred') {
+            displayContent();
+        }
+    } catch (error) {
+        console.error('Error reloading briefing:', error);
+    }
+}
+
 function setupNavigation() {
     document.querySelectorAll('.nav-tab').forEach(tab => {
         tab.addEventListener('click', function() {
@@ -52,13 +144,17 @@ function setupFilters() {
 async function loadBriefing() {
     try {
         showLoading();
-        const response = await fetch('/api/morning-briefing');
+        const [response, htmlResponse] = await Promise.all([
+            fetch('/api/morning-briefing'),
+            showsBriefingHtml() ? fetch('/api/morning-briefing.html') : null
+        ]);
         
         if (!response.ok) {
             throw new Error(`HTTP ${response.status}: ${response.statusText}`);
         }
         
         currentData = await response.json();
+        briefingHtml = htmlResponse && htmlResponse.ok ? await htmlResponse.text() : null;
         console.log('Briefing data loaded:', currentData);
         displayContent();
     } catch (error) {
@@ -91,22 +187,17 @@ async function refreshNews() {
     refreshIcon.style.animation = 'spin 1s linear infinite';
     
     try {
-        // Trigger collection
-        const response = await fetch('/api/collect', { method: 'POST' });
+        // Collect and get the rebuilt briefing back in one request
+        const response = await fetch('/api/collect?wait=1', { method: 'POST' });
         
         if (!response.ok) {
             throw new Error(`Collection failed: ${response.statusText}`);
         }
         
-        // Wait a moment then reload
-        setTimeout(async () => {
-            if (currentView === 'reading-list') {
-                await displayContent(); // Will reload reading list
-            } else {
-                await loadBriefing();
-            }
-            refreshIcon.style.animation = 'none';
-        }, 5000);
+        currentData = await response.json();
+        briefingHtml = null;
+        await displayContent();
+        refreshIcon.style.animation = 'none';
     } catch (error) {
         console.error('Error refreshing:', error);
         refreshIcon.style.animation = 'none';
@@ -116,7 +207,7 @@ async function refreshNews() {
 
 async function markAsRead(articleId, element) {
     try {
-        const response = await fetch(`/api/articles/${articleId}/read`, { method: 'POST' });
+        const response = await fetch(`/api/articles/${encodeURIComponent(articleId)}/read`, { method: 'POST' });
         
         if (!response.ok) {
             throw new Error(`Failed to toggle read status: ${response.statusText}`);
@@ -148,7 +239,7 @@ async function toggleStar(articleId, element) {
         const card = element.closest('.article-card');
         const isStarred = card.classList.contains('starred');
         
-        const response = await fetch(`/api/articles/${articleId}/star`, { 
+        const response = await fetch(`/api/articles/${encodeURIComponent(articleId)}/star`, { 
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({ starred: !isStarred })
@@ -177,7 +268,7 @@ async function toggleStar(articleId, element) {
 
 async function passArticle(articleId, element) {
     try {
-        const response = await fetch(`/api/articles/${articleId}/pass`, { method: 'POST' });
+        const response = await fetch(`/api/articles/${encodeURIComponent(articleId)}/pass`, { method: 'POST' });
         
         if (!response.ok) {
             throw new Error(`Failed to pass article: ${response.statusText}`);
@@ -201,6 +292,9 @@ async function passArticle(articleId, element) {
 }
 
 function openArticle(url, summaryElement) {
+    // Feed URLs are untrusted; never hand a javascript: or data: URL to window.open
+    if (!/^https?:\/\//i.test(url || '')) return;
+    
     // Mark the summary as clicked (visual feedback)
     if (summaryElement) {
         summaryElement.style.background = 'linear-gradient(135deg, #e8ecff, #d4e3ff)';
@@ -299,7 +393,7 @@ async function displayContent() {
     
     try {
         if (currentView === 'briefing') {
-            contentDiv.innerHTML = displayAllCategories();
+            contentDiv.innerHTML = showsBriefingHtml() && briefingHtml ? briefingHtml : displayAllCategories();
         } else if (currentView === 'starred') {
             contentDiv.innerHTML = displayStarredArticles();
         } else {
@@ -377,13 +471,7 @@ function getCurrentCategoryData() {
 }
 
 function getAllArticles() {
-    const allArticles = [];
-    ['ai', 'finance', 'politics'].forEach(category => {
-        if (currentData.briefing[category]) {
-            allArticles.push(...currentData.briefing[category]);
-        }
-    });
-    return allArticles;
+    return CATEGORIES.flatMap(category => currentData.briefing[category.key] || []);
 }
 
 function applyFilters(articles) {
@@ -400,14 +488,8 @@ function applyFilters(articles) {
 
 function displayAllCategories() {
     let html = '';
-    
-    const categories = [
-        { key: 'ai', title: 'AI & Technology', icon: 'AI' },
-        { key: 'finance', title: 'Finance & Markets', icon: 'FIN' },
-        { key: 'politics', title: 'Politics & Policy', icon: 'POL' }
-    ];
 
-    categories.forEach(category => {
+    CATEGORIES.forEach(category => {
         const articles = applyFilters(currentData.briefing[category.key] || []);
         if (articles.length > 0) {
             const highPriorityCount = articles.filter(a => a.priority === 'high').length;
@@ -432,14 +514,14 @@ function displayAllCategories() {
         }
     });
 
-    return html || '<div class="empty-state"><div class="empty-state-icon">∅</div><h3>No articles match current filters</h3><p>Try adjusting your filters or refresh to collect the latest news.</p></div>';
+    return html || EMPTY_FILTER_HTML;
 }
 
 function displaySingleCategory(categoryKey) {
     const articles = applyFilters(currentData.briefing[categoryKey] || []);
     
     if (articles.length === 0) {
-        return '<div class="empty-state"><div class="empty-state-icon">∅</div><h3>No articles match current filters</h3><p>Try adjusting your filters or refresh to collect the latest news.</p></div>';
+        return EMPTY_FILTER_HTML;
     }
 
     return `
@@ -479,12 +561,12 @@ function createArticleCard(article, showPassButton = false) {
     // Create action buttons
     let actionButtons = `
         <button class="action-btn read-btn ${readBtnClass}" 
-                onclick="markAsRead('${escapeHtml(article.id)}', this)" 
+                data-action="read" 
                 title="${readTitle}">
             ${readIcon}
         </button>
         <button class="action-btn star-btn ${starBtnClass}" 
-                onclick="toggleStar('${escapeHtml(article.id)}', this)" 
+                data-action="star" 
                 title="Star article">
             ${starIcon}
         </button>
@@ -494,7 +576,7 @@ function createArticleCard(article, showPassButton = false) {
     if (showPassButton || currentView === 'briefing') {
         actionButtons += `
             <button class="action-btn pass-btn" 
-                    onclick="passArticle('${escapeHtml(article.id)}', this)" 
+                    data-action="pass" 
                     title="Pass/dismiss article">
                 ✕
             </button>
@@ -502,7 +584,8 @@ function createArticleCard(article, showPassButton = false) {
     }
     
     return `
-        <article class="article-card ${readClass} ${starredClass}">
+        <article class="article-card ${readClass} ${starredClass}"
+                 data-id="${escapeHtml(article.id)}" data-url="${escapeHtml(article.url)}">
             <div class="article-actions">
                 ${actionButtons}
             </div>
@@ -516,14 +599,14 @@ function createArticleCard(article, showPassButton = false) {
                         <span class="reading-time">${article.readingTime || 2}min read</span>
                     </div>
                 </div>
-                <h3 class="article-title" onclick="openArticle('${escapeHtml(article.url)}', this)">
+                <h3 class="article-title" data-action="open">
                     ${escapeHtml(article.title)}
                 </h3>
             </div>
             
             <div class="article-content">
                 ${article.aiSummary ? `
-                    <div class="article-summary" onclick="openArticle('${escapeHtml(article.url)}', this)" title="Click to read full article">
+                    <div class="article-summary" data-action="open" title="Click to read full article">
                         ${escapeHtml(article.aiSummary)}
                     </div>
                 ` : ''}
@@ -534,9 +617,11 @@ function createArticleCard(article, showPassButton = false) {
     `;
 }
 
+// Escaping by lookup avoids creating a throwaway DOM node for every field of every card.
+// Safe for text and quoted attribute values only; never interpolate the result into inline JS.
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+
 function escapeHtml(text) {
     if (!text) return '';
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
+    return String(text).replace(/[&<>"']/g, char => HTML_ESCAPES[char]);
 }